@@ -1,16 +1,22 @@
+import os
+
 from flask import Flask, jsonify
 from flasgger import Swagger
 
 from dynaconf.contrib import FlaskDynaconf
 
-from game.games import Game, GameDoesNotExist
-from parser import LogParser, MemoryGameRepository
+from game.games import Game, GameDoesNotExist, GameRepository
+from config import get_event_handler_registry, settings
+from ingest import ingest
+from parser import (EventHandlerRegistry, MemoryGameRepository,
+                    SnapshotGameRepository)
+from parser.snapshot import InvalidSnapshot, read_handlers
 
 
 app = Flask('game')
 
 # setup settings
-FlaskDynaconf(app)
+FlaskDynaconf(app, dynaconf_instance=settings)
 
 # setup swagger
 app.config['SWAGGER'] = {
@@ -21,7 +27,13 @@ app.config['SWAGGER'] = {
 }
 swagger = Swagger(app)
 
-game_repository = MemoryGameRepository()
+# serve games published by `ingest.py` when a snapshot file is configured,
+# so every worker process shares it instead of parsing the log file again
+game_repository: GameRepository
+if app.config.get('GAME_SNAPSHOT'):
+    game_repository = SnapshotGameRepository(app.config['GAME_SNAPSHOT'])
+else:
+    game_repository = MemoryGameRepository()
 
 
 def format_game_to_dict(game: Game) -> dict:
@@ -155,8 +167,26 @@ def get_game_by_uid(uid):
         return jsonify(response), 404
 
 
+def is_snapshot_fresh(log_file: str, snapshot_file: str,
+                      registry: EventHandlerRegistry) -> bool:
+    if not os.path.exists(snapshot_file):
+        return False
+    if os.path.getmtime(snapshot_file) < os.path.getmtime(log_file):
+        return False
+    try:
+        handlers = read_handlers(snapshot_file)
+    except InvalidSnapshot:
+        return False
+    return handlers == registry.get_signature()
+
+
 if __name__ == '__main__':
-    parser = LogParser(game_repository)
-    parser.parse('./data/games.log')
+    if not app.config.get('GAME_SNAPSHOT'):
+        log_file = './data/games.log'
+        snapshot_file = './data/games.snapshot'
+        registry = get_event_handler_registry() or EventHandlerRegistry()
+        if not is_snapshot_fresh(log_file, snapshot_file, registry):
+            ingest(log_file, snapshot_file, registry)
+        game_repository = SnapshotGameRepository(snapshot_file)
 
     app.run()
@@ -0,0 +1,18 @@
+from typing import Optional
+
+from dynaconf import LazySettings
+
+from parser import EventHandlerRegistry
+
+
+# shared by the API and the ingest process, read from `FLASK_` prefixed
+# environment variables like the Flask app always did
+settings = LazySettings(ENVVAR_PREFIX='FLASK', ENV_SWITCHER='FLASK_ENV',
+                        ENVIRONMENTS=True, LOAD_DOTENV=True)
+
+
+def get_event_handler_registry() -> Optional[EventHandlerRegistry]:
+    event_handlers = settings.get('EVENT_HANDLERS')
+    if not event_handlers:
+        return None
+    return EventHandlerRegistry.from_config(event_handlers)
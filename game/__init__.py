@@ -1,3 +1,5 @@
 from .games import (Game, Player, GameRepository, GameDoesNotExist,
                     PlayerDoesNotExist)
-from .events import EventType, EventTypeNotMapped, EventHandler, EventObservable
+from .events import (EventType, EventTypeNotMapped, EventHandler, EventObservable,
+                     MalformedEvent)
+from .symbols import SymbolTable
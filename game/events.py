@@ -1,14 +1,19 @@
 import abc
 import enum
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from .games import GameRepository
+from .symbols import SymbolTable
 
 
 class EventTypeNotMapped(ValueError):
     pass
 
 
+class MalformedEvent(ValueError):
+    pass
+
+
 class EventType(enum.Enum):
     INIT_GAME = 'InitGame'
     SHUTDOWN_GAME = 'ShutdownGame'
@@ -17,8 +22,10 @@ class EventType(enum.Enum):
 
 class EventHandler(abc.ABC):
 
-    def __init__(self, repository: GameRepository) -> None:
+    def __init__(self, repository: GameRepository,
+                 symbols: Optional[SymbolTable] = None) -> None:
         self.repository = repository
+        self.symbols = SymbolTable() if symbols is None else symbols
 
     @abc.abstractmethod
     def handle(self, event: str) -> None:
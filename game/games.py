@@ -1,5 +1,5 @@
 import abc
-from typing import Optional, MutableSet
+from typing import Dict, Optional, ValuesView
 
 
 class GameDoesNotExist(Exception):
@@ -12,6 +12,8 @@ class PlayerDoesNotExist(Exception):
 
 class Player:
 
+    __slots__ = ('name', 'kills')
+
     def __init__(self, name: str) -> None:
         self.name = name
         self.kills = 0
@@ -35,10 +37,15 @@ class Game:
         self.uid = uid
         self.total_kills = 0
         self.shutted_down = False
-        self.players: MutableSet[Player] = set([])
+        self.map_name: Optional[str] = None
+        self.players_by_name: Dict[str, Player] = {}
+
+    @property
+    def players(self) -> ValuesView[Player]:
+        return self.players_by_name.values()
 
     def add_player(self, player: Player) -> None:
-        self.players.add(player)
+        self.players_by_name[player.name] = player
 
     def increase_total_kills(self) -> None:
         self.total_kills += 1
@@ -50,12 +57,7 @@ class Game:
         return self.shutted_down
 
     def get_player(self, name: str) -> Optional[Player]:
-        player_found = None
-        for player in self.players:
-            if player.name == name:
-                player_found = player
-                break
-        return player_found
+        return self.players_by_name.get(name)
 
     def has_player(self, name: str) -> bool:
         return bool(self.get_player(name))
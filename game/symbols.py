@@ -0,0 +1,30 @@
+from typing import Dict, List
+
+
+class SymbolTable:
+    """Interns strings that repeat across games, like players and map names.
+
+    Every distinct value is stored once and gets a small integer id, so
+    games can share the same string objects instead of holding copies.
+    """
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def intern(self, value: str) -> str:
+        return self.values[self.id_of(value)]
+
+    def id_of(self, value: str) -> int:
+        try:
+            return self.ids[value]
+        except KeyError:
+            symbol_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+            return symbol_id
+
+    def value_of(self, symbol_id: int) -> str:
+        return self.values[symbol_id]
@@ -0,0 +1,30 @@
+import argparse
+from typing import Optional
+
+from config import get_event_handler_registry
+from parser import (EventHandlerRegistry, LogParser, MemoryGameRepository,
+                    dump_snapshot)
+
+
+def ingest(log_file: str, snapshot_file: str,
+           registry: Optional[EventHandlerRegistry] = None,
+           quarantine_file: Optional[str] = None) -> None:
+    """Parse `log_file` and publish its games to `snapshot_file`."""
+    game_repository = MemoryGameRepository({})
+    parser = LogParser(game_repository, registry, quarantine_file)
+    parser.parse(log_file)
+    if parser.rejected_events:
+        print(f'{parser.rejected_events} malformed events rejected.')
+    dump_snapshot(game_repository, snapshot_file, parser.registry.get_signature())
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(
+        description='Parse a game log file and publish it as a snapshot.')
+    arg_parser.add_argument('log_file', nargs='?', default='./data/games.log')
+    arg_parser.add_argument('snapshot_file', nargs='?', default='./data/games.snapshot')
+    arg_parser.add_argument('--quarantine-file',
+                            help='file where malformed events are written to')
+    args = arg_parser.parse_args()
+    ingest(args.log_file, args.snapshot_file, get_event_handler_registry(),
+           args.quarantine_file)
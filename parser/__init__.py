@@ -1,2 +1,4 @@
 from .parser import LogParser  # noqa: F401
-from .repositories import MemoryGameRepository  # noqa: F401
+from .registry import EventHandlerRegistry  # noqa: F401
+from .repositories import MemoryGameRepository, SnapshotGameRepository  # noqa: F401
+from .snapshot import dump_snapshot  # noqa: F401
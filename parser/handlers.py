@@ -1,16 +1,25 @@
 import uuid
 import re
-from typing import Tuple
+from typing import Optional, Tuple
 
-from game import Game, GameDoesNotExist, Player, EventHandler
+from game import Game, GameDoesNotExist, Player, EventHandler, MalformedEvent
 
 
 class InitGameEventHandler(EventHandler):
 
+    map_name_pattern = re.compile(r'\\mapname\\(?P<map_name>[^\\]+)')
+
     def handle(self, event: str) -> None:
         game = Game(str(uuid.uuid4()))
+        game.map_name = self._get_map_name(event)
         self.repository.add(game)
 
+    def _get_map_name(self, event: str) -> Optional[str]:
+        match = self.map_name_pattern.search(event)
+        if not match:
+            return None
+        return self.symbols.intern(match.group('map_name'))
+
 
 class ShutdownGameEventHandler(EventHandler):
 
@@ -33,7 +42,11 @@ class KillEventHandler(EventHandler):
         r'[\d{,2}.+]: (?P<killer><?\w.+>?) killed (?P<killed>\w.+) by')
 
     def handle(self, event: str) -> None:
-        active_game = self.repository.get_active_game()
+        try:
+            active_game = self.repository.get_active_game()
+        except GameDoesNotExist as err:
+            # a kill before any InitGame, e.g. in a rotated or truncated log
+            raise MalformedEvent(event) from err
         player_killer, player_killed = self.get_players(active_game, event)
         if player_killer.is_world():
             player_killed.decrease_kills(1)
@@ -47,10 +60,14 @@ class KillEventHandler(EventHandler):
     def get_players(self, active_game: Game, event: str) -> Tuple[Player, Player]:
         killer, killed = self._get_players_names(event)
         player_killer = active_game.get_player(killer) or Player(killer)
+        if killed == killer:
+            return player_killer, player_killer
         player_killed = active_game.get_player(killed) or Player(killed)
         return player_killer, player_killed
 
     def _get_players_names(self, event: str) -> Tuple[str, str]:
-        match = self.players_pattern.findall(event)
-        killer_name, killed_name = match[0]
-        return killer_name, killed_name
+        match = self.players_pattern.search(event)
+        if not match:
+            raise MalformedEvent(event)
+        killer_name, killed_name = match.groups()
+        return self.symbols.intern(killer_name), self.symbols.intern(killed_name)
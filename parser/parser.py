@@ -1,57 +1,92 @@
 import re
-from typing import Generator
+from contextlib import ExitStack
+from typing import Dict, Generator, Optional
 
-from game import GameRepository, EventObservable, EventType, EventTypeNotMapped
+from game import (GameRepository, EventObservable, EventType, MalformedEvent,
+                  SymbolTable)
 
-from parser.handlers import (InitGameEventHandler, ShutdownGameEventHandler,
-                             KillEventHandler)
+from parser.registry import EventHandlerRegistry
 
 
 class LogParser:
 
-    event_type_pattern = re.compile(r'(?P<time>\d{,2}:\d{2}) (?P<event_type>\w+):')
+    event_time_pattern = re.compile(r'\s*\d+:\d{2} ')
     shutdown_game_pattern = re.compile(r'(\s.*)?(?P<time>\d{,3}:\d{2}) [ -]+')
 
-    def __init__(self, game_repository: GameRepository) -> None:
+    def __init__(self, game_repository: GameRepository,
+                 registry: Optional[EventHandlerRegistry] = None,
+                 quarantine_file: Optional[str] = None) -> None:
         self.game_repository = game_repository
+        self.quarantine_file = quarantine_file
+        self.rejected_events = 0
+        self.registry = registry or EventHandlerRegistry()
+        self.symbols = SymbolTable()
         self.event_observable = EventObservable()
+        self.event_types: Dict[str, EventType] = {}
+        self.shutdown_enabled = False
         self._register_events_handlers()
 
     def _register_events_handlers(self) -> None:
-        self.event_observable.add_handler(EventType.INIT_GAME,
-                                          InitGameEventHandler(self.game_repository))
-        self.event_observable.add_handler(EventType.SHUTDOWN_GAME,
-                                          ShutdownGameEventHandler(self.game_repository))
-        self.event_observable.add_handler(EventType.KILL,
-                                          KillEventHandler(self.game_repository))
+        for event_type in self.registry.get_enabled_event_types():
+            handler_class = self.registry.load(event_type)
+            self.event_observable.add_handler(event_type,
+                                              handler_class(self.game_repository,
+                                                            self.symbols))
+            self.event_types[f'{event_type.value}:'] = event_type
+        self.shutdown_enabled = EventType.SHUTDOWN_GAME in self.event_types.values()
 
     def parse(self, log_file: str) -> None:
-        file = self._read_log_file(log_file)
-        for event in file:
-            try:
-                event_type: EventType = self._get_event_type(event)
-            except EventTypeNotMapped:
-                print(f'Event type {event} not mapped.')
-            else:
-                self.event_observable.notify(event_type, event)
-
-    def _get_event_type(self, event: str) -> EventType:
-        if self._is_shutdown_event_type(event):
-            return EventType.SHUTDOWN_GAME
-        return self._get_generic_event_type(event)
+        """Parse `log_file`, setting malformed events aside instead of stopping.
+
+        Malformed events, including lines that aren't valid UTF-8, are
+        counted in `rejected_events` and, when a `quarantine_file` is given,
+        written to it as they were read.
+        """
+        with ExitStack() as stack:
+            quarantine = None
+            if self.quarantine_file:
+                quarantine = stack.enter_context(open(self.quarantine_file, 'wb'))
+            for line in self._read_log_file(log_file):
+                try:
+                    event = line.decode('utf-8')
+                    event_type = self._get_event_type(event)
+                    if event_type is not None:
+                        self.event_observable.notify(event_type, event)
+                except (MalformedEvent, UnicodeDecodeError):
+                    self.rejected_events += 1
+                    if quarantine:
+                        quarantine.write(line)
+
+    def _get_event_type(self, event: str) -> Optional[EventType]:
+        """Classify `event` by the token after its timestamp.
+
+        The timestamp is matched with an anchored regex, then the token is
+        looked up in the table of enabled event types, so only the token is
+        sliced out of the line. Returns `None` for events that aren't
+        enabled and for blank lines. Other lines without a timestamp, apart
+        from game separators, are malformed.
+        """
+        match = self.event_time_pattern.match(event)
+        if not match:
+            if not event or event.isspace():
+                return None
+            if self._is_shutdown_event_type(event):
+                return self._get_shutdown_event_type()
+            raise MalformedEvent(event)
+        start = match.end()
+        if event.startswith('-', start):
+            return self._get_shutdown_event_type()
+        end = event.find(' ', start)
+        token = event[start:].rstrip() if end == -1 else event[start:end]
+        return self.event_types.get(token)
+
+    def _get_shutdown_event_type(self) -> Optional[EventType]:
+        return EventType.SHUTDOWN_GAME if self.shutdown_enabled else None
 
     def _is_shutdown_event_type(self, event: str) -> bool:
         return bool(self.shutdown_game_pattern.match(event))
 
-    def _get_generic_event_type(self, event: str) -> EventType:
-        match = self.event_type_pattern.findall(event)
-        event_time, event_type = match[0]
-        try:
-            return EventType(event_type)
-        except ValueError as err:
-            raise EventTypeNotMapped() from err
-
-    def _read_log_file(self, log_file: str) -> Generator[str, None, None]:
-        with open(log_file, 'r') as file:
+    def _read_log_file(self, log_file: str) -> Generator[bytes, None, None]:
+        with open(log_file, 'rb') as file:
             for line in file:
-                yield str(line)
+                yield line
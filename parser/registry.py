@@ -0,0 +1,56 @@
+import importlib
+from typing import Dict, List, Mapping, Optional, Type
+
+from game import EventHandler, EventType, EventTypeNotMapped
+
+
+DEFAULT_EVENT_HANDLERS: Dict[EventType, str] = {
+    EventType.INIT_GAME: 'parser.handlers.InitGameEventHandler',
+    EventType.SHUTDOWN_GAME: 'parser.handlers.ShutdownGameEventHandler',
+    EventType.KILL: 'parser.handlers.KillEventHandler',
+}
+
+
+class EventHandlerRegistry:
+    """Maps event types to the dotted path of their handler class.
+
+    Handler modules are only imported when the handler is loaded, so event
+    types that aren't enabled don't cost an import at startup.
+    Event types are limited to the members of `EventType`.
+    """
+
+    def __init__(self, handlers: Optional[Mapping[EventType, str]] = None) -> None:
+        if handlers is None:
+            handlers = DEFAULT_EVENT_HANDLERS
+        self.handlers: Dict[EventType, str] = dict(handlers)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, str]) -> 'EventHandlerRegistry':
+        """Build a registry from `{'Kill': 'parser.handlers.KillEventHandler'}`."""
+        handlers = {}
+        for event_type, handler_path in config.items():
+            try:
+                handlers[EventType(event_type)] = handler_path
+            except ValueError as err:
+                raise EventTypeNotMapped(event_type) from err
+        return cls(handlers)
+
+    def register(self, event_type: EventType, handler_path: str) -> None:
+        self.handlers[event_type] = handler_path
+
+    def unregister(self, event_type: EventType) -> None:
+        self.handlers.pop(event_type, None)
+
+    def get_enabled_event_types(self) -> List[EventType]:
+        return list(self.handlers)
+
+    def get_signature(self) -> str:
+        """Describe the enabled handlers, e.g. `Kill=parser.handlers.KillEventHandler`."""
+        handlers = sorted(f'{event_type.value}={handler_path}'
+                          for event_type, handler_path in self.handlers.items())
+        return ';'.join(handlers)
+
+    def load(self, event_type: EventType) -> Type[EventHandler]:
+        module_name, _, class_name = self.handlers[event_type].rpartition('.')
+        module = importlib.import_module(module_name)
+        return getattr(module, class_name)
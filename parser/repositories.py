@@ -1,13 +1,30 @@
-from typing import Dict
+import mmap
+import os
+from typing import Dict, List, Optional, Tuple
 
 from game import Game, GameRepository, GameDoesNotExist
 
+from parser import snapshot
+
+
+class ReadOnlyRepository(Exception):
+    pass
+
 
 class MemoryGameRepository(GameRepository):
+    """Keeps games in a dictionary.
+
+    Instances share the class level `store` unless they're given their own.
+    """
 
     store: Dict[str, Game] = {}
     active_game_uid: str = ''
 
+    def __init__(self, store: Optional[Dict[str, Game]] = None) -> None:
+        if store is not None:
+            self.store = store
+            self.active_game_uid = ''
+
     def get_games(self) -> dict:
         return self.store
 
@@ -33,3 +50,77 @@ class MemoryGameRepository(GameRepository):
 
     def update(self, game: Game) -> None:
         pass
+
+
+class SnapshotGameRepository(GameRepository):
+    """Read-only repository backed by a memory-mapped snapshot file.
+
+    Only the names table and the games index are decoded when the snapshot
+    is opened, each game is decoded when it's requested and not kept around,
+    so workers don't build their own copy of the archive. The file is
+    checked on every lookup and mapped again when an ingest process has
+    published a new snapshot, so several API workers can share one copy of
+    the games through the page cache.
+    """
+
+    def __init__(self, snapshot_file: str) -> None:
+        self.snapshot_file = snapshot_file
+        self.snapshot: Optional[MappedSnapshot] = None
+        self.snapshot_stat: Optional[Tuple[int, int, int]] = None
+
+    def get_games(self) -> dict:
+        mapped = self._get_snapshot()
+        if mapped is None:
+            return {}
+        return {uid: mapped.get_game(uid) for uid in mapped.index}
+
+    def get_game_by_uid(self, uid: str) -> Game:
+        mapped = self._get_snapshot()
+        if mapped is None:
+            raise GameDoesNotExist()
+        try:
+            return mapped.get_game(uid)
+        except KeyError as err:
+            raise GameDoesNotExist() from err
+
+    def get_active_game(self) -> Game:
+        raise GameDoesNotExist()
+
+    def add(self, game: Game) -> None:
+        raise ReadOnlyRepository()
+
+    def update(self, game: Game) -> None:
+        raise ReadOnlyRepository()
+
+    def _get_snapshot(self) -> Optional['MappedSnapshot']:
+        try:
+            stat = os.stat(self.snapshot_file)
+        except FileNotFoundError:
+            return self.snapshot
+        snapshot_stat = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        if snapshot_stat != self.snapshot_stat:
+            self.snapshot_stat = snapshot_stat
+            try:
+                self.snapshot = MappedSnapshot(self.snapshot_file)
+            except snapshot.InvalidSnapshot as err:
+                class_name = self.__class__.__name__
+                print(f'{class_name}: {self.snapshot_file} was not loaded: {err} '
+                      '** Keeping the previously loaded snapshot.')
+        return self.snapshot
+
+
+class MappedSnapshot:
+
+    def __init__(self, snapshot_file: str) -> None:
+        with open(snapshot_file, 'rb') as file:
+            try:
+                self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as err:
+                raise snapshot.InvalidSnapshot('Snapshot file is empty.') from err
+        self.names: List[str]
+        self.index: Dict[str, Tuple[int, int]]
+        self.names, self.index = snapshot.decode_header(self.buffer)
+
+    def get_game(self, uid: str) -> Game:
+        offset, size = self.index[uid]
+        return snapshot.decode_game(self.buffer, uid, offset, size, self.names)
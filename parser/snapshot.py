@@ -0,0 +1,183 @@
+"""Compact, versioned binary snapshot of a game repository.
+
+Layout (all integers little-endian)::
+
+    header   magic(4s) version(H) names_count(I) games_count(I)
+    handlers length(H) utf-8 bytes
+    names    names_count * [length(H) utf-8 bytes]
+    index    games_count * [uid length(H) utf-8 bytes, offset(Q), size(I)]
+    records  games_count * [total_kills(I) shutted_down(B) map name id(I)
+                            players_count(H)
+                            players_count * [name id(I) kills(i)]]
+
+Player and map names are stored once in the names table and referenced by
+id from the game records, a game without map name has `NO_NAME` as id.
+The index lets a reader decode a single game on demand. `handlers` tells
+which event handlers were enabled when the games were parsed.
+"""
+import os
+import struct
+import tempfile
+from typing import Dict, Iterator, List, Tuple
+
+from game import Game, GameRepository, Player, SymbolTable
+
+
+MAGIC = b'GLPS'
+VERSION = 3
+NO_NAME = 0xFFFFFFFF
+
+HEADER = struct.Struct('<4sHII')
+LENGTH = struct.Struct('<H')
+INDEX_ENTRY = struct.Struct('<QI')
+GAME_RECORD = struct.Struct('<IBIH')
+PLAYER_RECORD = struct.Struct('<Ii')
+
+
+class InvalidSnapshot(ValueError):
+    pass
+
+
+def dump_snapshot(repository: GameRepository, snapshot_file: str,
+                  handlers: str = '') -> None:
+    """Write every game held by `repository` to `snapshot_file`.
+
+    The snapshot is written to a temporary file which then replaces
+    `snapshot_file`, so readers never see a partially written snapshot.
+    """
+    directory = os.path.dirname(os.path.abspath(snapshot_file))
+    fd, tmp_file = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, 'wb') as file:
+            file.write(encode_games(repository.get_games(), handlers))
+        os.replace(tmp_file, snapshot_file)
+    except BaseException:
+        os.unlink(tmp_file)
+        raise
+
+
+def read_handlers(snapshot_file: str) -> str:
+    """Return the handlers `snapshot_file` was parsed with.
+
+    Raises `InvalidSnapshot` when it isn't a snapshot this version can decode.
+    """
+    with open(snapshot_file, 'rb') as file:
+        header = file.read(HEADER.size + LENGTH.size)
+        _check_header(header)
+        try:
+            length, = LENGTH.unpack_from(header, HEADER.size)
+            handlers, _ = _decode_string(header + file.read(length), HEADER.size)
+        except (struct.error, UnicodeDecodeError) as err:
+            raise InvalidSnapshot('Snapshot handlers are corrupted.') from err
+    return handlers
+
+
+def encode_games(games: Dict[str, Game], handlers: str = '') -> bytes:
+    names = SymbolTable()
+    records: List[Tuple[str, bytes]] = []
+    for uid, game in games.items():
+        players = list(game.players)
+        map_name_id = NO_NAME if game.map_name is None else names.id_of(game.map_name)
+        record = [GAME_RECORD.pack(game.total_kills, game.is_shutted_down(),
+                                   map_name_id, len(players))]
+        for player in players:
+            name_id = names.id_of(player.name)
+            record.append(PLAYER_RECORD.pack(name_id, player.kills))
+        records.append((uid, b''.join(record)))
+
+    handlers_string = _encode_string(handlers)
+    names_table = b''.join(_encode_string(name) for name in names.values)
+    index_size = sum(LENGTH.size + len(uid.encode('utf-8')) + INDEX_ENTRY.size
+                     for uid, _ in records)
+    offset = HEADER.size + len(handlers_string) + len(names_table) + index_size
+
+    index = []
+    for uid, record in records:
+        index.append(_encode_string(uid) + INDEX_ENTRY.pack(offset, len(record)))
+        offset += len(record)
+
+    header = HEADER.pack(MAGIC, VERSION, len(names), len(records))
+    records_table = b''.join(record for _, record in records)
+    return b''.join([header, handlers_string, names_table, b''.join(index),
+                     records_table])
+
+
+def decode_header(buffer) -> Tuple[List[str], Dict[str, Tuple[int, int]]]:
+    """Return the names table and the `uid -> (offset, size)` index."""
+    names_count, games_count = _check_header(buffer)
+    names = []
+    index = {}
+    try:
+        _, position = _decode_string(buffer, HEADER.size)
+        for _ in range(names_count):
+            name, position = _decode_string(buffer, position)
+            names.append(name)
+
+        for _ in range(games_count):
+            uid, position = _decode_string(buffer, position)
+            index[uid] = INDEX_ENTRY.unpack_from(buffer, position)
+            position += INDEX_ENTRY.size
+    except (struct.error, UnicodeDecodeError) as err:
+        raise InvalidSnapshot('Snapshot names table or index is corrupted.') from err
+    return names, index
+
+
+def decode_game(buffer, uid: str, offset: int, size: int, names: List[str]) -> Game:
+    """Decode the `size` bytes long record of game `uid` found at `offset`."""
+    record = buffer[offset:offset + size]
+    try:
+        total_kills, shutted_down, map_name_id, players_count = \
+            GAME_RECORD.unpack_from(record, 0)
+    except struct.error as err:
+        raise InvalidSnapshot(f'Record of game {uid} is truncated.') from err
+    if len(record) != GAME_RECORD.size + players_count * PLAYER_RECORD.size:
+        raise InvalidSnapshot(f'Record of game {uid} is corrupted.')
+
+    game = Game(uid)
+    game.total_kills = total_kills
+    if shutted_down:
+        game.shutdown()
+    try:
+        if map_name_id != NO_NAME:
+            game.map_name = names[map_name_id]
+        for name_id, kills in _iter_players(record, GAME_RECORD.size, players_count):
+            player = Player(names[name_id])
+            player.kills = kills
+            game.add_player(player)
+    except IndexError as err:
+        raise InvalidSnapshot(f'Record of game {uid} refers to an unknown name.') from err
+    return game
+
+
+def _check_header(buffer) -> Tuple[int, int]:
+    """Return the names and games counts of a header this version can decode."""
+    try:
+        magic, version, names_count, games_count = HEADER.unpack_from(buffer, 0)
+    except struct.error as err:
+        raise InvalidSnapshot('Snapshot header is truncated.') from err
+    if magic != MAGIC:
+        raise InvalidSnapshot('Not a game snapshot file.')
+    if version != VERSION:
+        raise InvalidSnapshot(f'Unsupported snapshot version {version}.')
+    return names_count, games_count
+
+
+def _iter_players(buffer, offset: int, count: int) -> Iterator[Tuple[int, int]]:
+    for _ in range(count):
+        yield PLAYER_RECORD.unpack_from(buffer, offset)
+        offset += PLAYER_RECORD.size
+
+
+def _encode_string(value: str) -> bytes:
+    encoded = value.encode('utf-8')
+    return LENGTH.pack(len(encoded)) + encoded
+
+
+def _decode_string(buffer, position: int) -> Tuple[str, int]:
+    length, = LENGTH.unpack_from(buffer, position)
+    position += LENGTH.size
+    encoded = bytes(buffer[position:position + length])
+    if len(encoded) != length:
+        raise struct.error('string is truncated')
+    return encoded.decode('utf-8'), position + length
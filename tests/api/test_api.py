@@ -2,7 +2,9 @@ from unittest import mock
 
 from flask import url_for
 
-from parser import MemoryGameRepository
+from api import is_snapshot_fresh
+from game import EventType
+from parser import EventHandlerRegistry, MemoryGameRepository, dump_snapshot
 
 
 class TestHealthCheck:
@@ -40,3 +42,20 @@ class TestGameAPI:
         response = client.get(url_for('get_game_by_uid', uid='asdasd'))
         assert response.status_code == 404
         assert response.json['message'] == 'Game not found'
+
+
+class TestSnapshotFreshness:
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    def test_should_snapshot_be_stale_when_handlers_change(self, tmpdir):
+        log_file = tmpdir.join('games.log')
+        log_file.write('')
+        snapshot_file = str(tmpdir.join('games.snapshot'))
+        registry = EventHandlerRegistry()
+        assert is_snapshot_fresh(str(log_file), snapshot_file, registry) is False
+
+        dump_snapshot(MemoryGameRepository(), snapshot_file, registry.get_signature())
+        assert is_snapshot_fresh(str(log_file), snapshot_file, registry) is True
+
+        registry.unregister(EventType.SHUTDOWN_GAME)
+        assert is_snapshot_fresh(str(log_file), snapshot_file, registry) is False
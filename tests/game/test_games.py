@@ -16,6 +16,15 @@ class TestGame:
         game.add_player(player)
         assert len(game.players) == 1
 
+    def test_should_replace_player_with_same_name(self):
+        game = Game('abc')
+        game.add_player(Player('foo'))
+        player = Player('foo')
+        game.add_player(player)
+        assert len(game.players) == 1
+        assert list(game.players) == [player]
+        assert game.get_player('foo') is player
+
     def test_should_get_player(self):
         game = Game('abc')
         player = Player('foo')
@@ -0,0 +1,17 @@
+from game import SymbolTable
+
+
+class TestSymbolTable:
+
+    def test_should_intern_value(self):
+        symbols = SymbolTable()
+        value = symbols.intern(''.join(['Is', 'galamido']))
+        assert symbols.intern(''.join(['Isga', 'lamido'])) is value
+        assert len(symbols) == 1
+
+    def test_should_assign_sequential_ids(self):
+        symbols = SymbolTable()
+        assert symbols.id_of('foo') == 0
+        assert symbols.id_of('bar') == 1
+        assert symbols.id_of('foo') == 0
+        assert symbols.value_of(1) == 'bar'
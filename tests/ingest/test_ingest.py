@@ -0,0 +1,23 @@
+from ingest import ingest
+from parser import SnapshotGameRepository
+
+
+LOG = """\
+  0:00 InitGame: \\sv_floodProtect\\1\\mapname\\q3dm17\\gamename\\baseq3
+ 21:07 Kill: 2 3 7: Isgalamido killed Mocinha by MOD_ROCKET_SPLASH
+ 21:10 ShutdownGame:
+"""
+
+
+class TestIngest:
+
+    def test_should_publish_only_ingested_games(self, tmpdir):
+        log_file = tmpdir.join('games.log')
+        log_file.write(LOG)
+        snapshot_file = str(tmpdir.join('games.snapshot'))
+
+        ingest(str(log_file), snapshot_file)
+        ingest(str(log_file), snapshot_file)
+
+        games = SnapshotGameRepository(snapshot_file).get_games()
+        assert len(games) == 1
@@ -1,6 +1,8 @@
 from unittest import mock
 
-from game import Game
+import pytest
+
+from game import Game, MalformedEvent, SymbolTable
 from parser import MemoryGameRepository
 from parser.handlers import (InitGameEventHandler, ShutdownGameEventHandler,
                              KillEventHandler)
@@ -26,12 +28,51 @@ class TestEventHandler:
         assert str(killer) == 'Foo'
         assert str(killed) == 'Bar'
 
+    def test_should_get_same_player_when_killing_itself(self):
+        handler = KillEventHandler(None)
+        event = '1:26 Kill: 2 2 7: Foo killed Foo by MOD_ROCKET_SPLASH'
+        killer, killed = handler.get_players(Game('abc'), event)
+        assert killer is killed
+
+    def test_should_reject_malformed_kill_event(self):
+        handler = KillEventHandler(None)
+        event = '1:26 Kill: 1022 4 22: Foo died'
+        with pytest.raises(MalformedEvent):
+            handler.get_players(Game('abc'), event)
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    @mock.patch.object(MemoryGameRepository, 'active_game_uid', '')
+    def test_should_reject_kill_event_before_init_game(self):
+        handler = KillEventHandler(MemoryGameRepository())
+        event = '1:23 Kill: 5 7 7: Oootsimo killed Fulera by MOD_ROCKET_SPLASH'
+        with pytest.raises(MalformedEvent):
+            handler.handle(event)
+
+    def test_should_intern_players_names(self):
+        symbols = SymbolTable()
+        handler = KillEventHandler(None, symbols)
+        event = '1:26 Kill: 1022 4 22: Foo killed Bar by MOD_TRIGGER_HURT'
+        killer, killed = handler.get_players(Game('abc'), event)
+        other_killer, other_killed = handler.get_players(Game('xyz'), event)
+        assert killer.name is other_killer.name
+        assert killed.name is other_killed.name
+        assert len(symbols) == 2
+
     @mock.patch.object(MemoryGameRepository, 'store', {})
     def test_should_handle_init_game_event(self):
         memory_repo = MemoryGameRepository()
         handler = InitGameEventHandler(memory_repo)
         handler.handle('  0:00 InitGame: \\sv_floodProtect\\1\\sv_maxPing\0')
         assert len(memory_repo.store) == 1
+        assert memory_repo.get_active_game().map_name is None
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    def test_should_handle_init_game_event_with_map_name(self):
+        memory_repo = MemoryGameRepository()
+        handler = InitGameEventHandler(memory_repo)
+        event = '  0:00 InitGame: \\protocol\\68\\mapname\\q3dm17\\gamename\\baseq3'
+        handler.handle(event)
+        assert memory_repo.get_active_game().map_name == 'q3dm17'
 
     @mock.patch.object(MemoryGameRepository, 'store', {})
     def test_should_handle_shutdown_game_event(self):
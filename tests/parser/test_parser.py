@@ -0,0 +1,107 @@
+from unittest import mock
+
+from game import EventType
+from parser import EventHandlerRegistry, LogParser, MemoryGameRepository
+
+
+LOG = """\
+  0:00 ------------------------------------------------------------
+  0:00 InitGame: \\sv_floodProtect\\1\\mapname\\q3dm17\\gamename\\baseq3
+ 20:34 ClientConnect: 2
+ 20:54 Kill: 1022 2 22: <world> killed Isgalamido by MOD_TRIGGER_HURT
+ 21:07 Kill: 2 3 7: Isgalamido killed Mocinha by MOD_ROCKET_SPLASH
+ 11:57 score: 20  ping: 4  client: 4 Zeh
+ 10:12 red:8  blue:6
+ 21:10 ShutdownGame:
+"""
+
+MALFORMED_LOG = b"""\
+ 0:00 Kill: 2 3 7: Isgalamido killed Zeh by MOD_ROCKET_SPLASH
+  0:00 InitGame: \\sv_floodProtect\\1\\mapname\\q3dm17\\gamename\\baseq3
+ 20:54 Kill: 1022 2 22: <world> died
+Kill: 2 3 7: Isgalamido killed Zeh by MOD_ROCKET_SPLASH
+ 20:58 Kill: 2 3 7: Isga\xff\xfelamido killed Zeh by MOD_ROCKET_SPLASH
+ 21:07 Kill: 2 3 7: Isgalamido killed Mocinha by MOD_ROCKET_SPLASH
+ 21:10 ShutdownGame:
+"""
+
+
+class TestLogParser:
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    def test_should_parse_log_file(self, tmpdir):
+        log_file = tmpdir.join('games.log')
+        log_file.write(LOG)
+        memory_repo = MemoryGameRepository()
+        LogParser(memory_repo).parse(str(log_file))
+
+        game = memory_repo.get_active_game()
+        assert game.total_kills == 2
+        assert game.map_name == 'q3dm17'
+        assert game.is_shutted_down() is True
+        assert game.get_player('Isgalamido').kills == 1
+
+    def test_should_classify_events_by_token(self):
+        registry = EventHandlerRegistry()
+        registry.unregister(EventType.SHUTDOWN_GAME)
+        parser = LogParser(MemoryGameRepository({}), registry)
+        assert parser._get_event_type(' 21:07 Kill: 2 3 7: a killed b by X\n') \
+            is EventType.KILL
+        assert parser._get_event_type(' 20:34 ClientConnect: 2\n') is None
+        assert parser._get_event_type(' 21:10 ShutdownGame:\n') is None
+        assert parser._get_event_type('  0:00 ------------\n') is None
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    def test_should_skip_disabled_events(self, tmpdir):
+        log_file = tmpdir.join('games.log')
+        log_file.write(LOG)
+        memory_repo = MemoryGameRepository()
+        registry = EventHandlerRegistry()
+        registry.unregister(EventType.KILL)
+        parser = LogParser(memory_repo, registry)
+
+        with mock.patch.object(parser.event_observable, 'notify') as notify:
+            parser.parse(str(log_file))
+
+        notified = [call[0][0] for call in notify.call_args_list]
+        assert EventType.KILL not in notified
+        assert notified == [EventType.SHUTDOWN_GAME, EventType.INIT_GAME,
+                            EventType.SHUTDOWN_GAME]
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    def test_should_quarantine_malformed_events(self, tmpdir):
+        log_file = tmpdir.join('games.log')
+        log_file.write_binary(MALFORMED_LOG)
+        quarantine_file = tmpdir.join('rejected.log')
+        memory_repo = MemoryGameRepository()
+        parser = LogParser(memory_repo, quarantine_file=str(quarantine_file))
+        parser.parse(str(log_file))
+
+        game = memory_repo.get_active_game()
+        assert game.total_kills == 1
+        assert game.is_shutted_down() is True
+        assert game.get_player('Isgalamido').kills == 1
+        assert parser.rejected_events == 4
+        assert quarantine_file.read_binary().splitlines() == [
+            b' 0:00 Kill: 2 3 7: Isgalamido killed Zeh by MOD_ROCKET_SPLASH',
+            b' 20:54 Kill: 1022 2 22: <world> died',
+            b'Kill: 2 3 7: Isgalamido killed Zeh by MOD_ROCKET_SPLASH',
+            b' 20:58 Kill: 2 3 7: Isga\xff\xfelamido killed Zeh by MOD_ROCKET_SPLASH',
+        ]
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    def test_should_count_malformed_events_without_quarantine_file(self, tmpdir):
+        log_file = tmpdir.join('games.log')
+        log_file.write_binary(MALFORMED_LOG)
+        parser = LogParser(MemoryGameRepository())
+        parser.parse(str(log_file))
+        assert parser.rejected_events == 4
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    def test_should_skip_blank_lines(self, tmpdir):
+        log_file = tmpdir.join('games.log')
+        log_file.write('\n' + LOG + '   \n\t\n')
+        parser = LogParser(MemoryGameRepository())
+        parser.parse(str(log_file))
+        assert parser.rejected_events == 0
+        assert parser.game_repository.get_active_game().total_kills == 2
@@ -0,0 +1,76 @@
+import sys
+
+import pytest
+
+from game import EventType, EventTypeNotMapped
+from parser import LogParser, MemoryGameRepository
+from parser.handlers import KillEventHandler
+from parser.registry import EventHandlerRegistry
+
+
+HANDLER_MODULE = '''\
+from game import EventHandler
+
+
+class KillEventHandler(EventHandler):
+
+    def handle(self, event):
+        pass
+'''
+
+
+class TestEventHandlerRegistry:
+
+    def test_should_enable_default_handlers(self):
+        registry = EventHandlerRegistry()
+        assert registry.get_enabled_event_types() == [
+            EventType.INIT_GAME, EventType.SHUTDOWN_GAME, EventType.KILL]
+
+    def test_should_load_handler(self):
+        registry = EventHandlerRegistry()
+        assert registry.load(EventType.KILL) is KillEventHandler
+
+    def test_should_register_and_unregister_handler(self):
+        registry = EventHandlerRegistry({})
+        registry.register(EventType.KILL, 'parser.handlers.KillEventHandler')
+        assert registry.get_enabled_event_types() == [EventType.KILL]
+        registry.unregister(EventType.KILL)
+        assert registry.get_enabled_event_types() == []
+
+    def test_should_describe_enabled_handlers(self):
+        registry = EventHandlerRegistry({
+            EventType.KILL: 'parser.handlers.KillEventHandler',
+            EventType.INIT_GAME: 'parser.handlers.InitGameEventHandler',
+        })
+        assert registry.get_signature() == (
+            'InitGame=parser.handlers.InitGameEventHandler;'
+            'Kill=parser.handlers.KillEventHandler')
+
+    def test_should_build_registry_from_config(self):
+        registry = EventHandlerRegistry.from_config(
+            {'Kill': 'parser.handlers.KillEventHandler'})
+        assert registry.get_enabled_event_types() == [EventType.KILL]
+
+        with pytest.raises(EventTypeNotMapped):
+            EventHandlerRegistry.from_config({'Foo': 'parser.handlers.KillEventHandler'})
+
+    def test_should_import_handler_module_only_when_loaded(self, tmpdir, monkeypatch):
+        tmpdir.join('lazy_kill_handler.py').write(HANDLER_MODULE)
+        monkeypatch.syspath_prepend(str(tmpdir))
+        registry = EventHandlerRegistry()
+        registry.register(EventType.KILL, 'lazy_kill_handler.KillEventHandler')
+        assert 'lazy_kill_handler' not in sys.modules
+
+        registry.load(EventType.KILL)
+        assert 'lazy_kill_handler' in sys.modules
+        monkeypatch.delitem(sys.modules, 'lazy_kill_handler')
+
+    def test_should_not_import_disabled_handler_module(self, tmpdir, monkeypatch):
+        tmpdir.join('disabled_kill_handler.py').write(HANDLER_MODULE)
+        monkeypatch.syspath_prepend(str(tmpdir))
+        registry = EventHandlerRegistry()
+        registry.register(EventType.KILL, 'disabled_kill_handler.KillEventHandler')
+        registry.unregister(EventType.KILL)
+
+        LogParser(MemoryGameRepository(), registry)
+        assert 'disabled_kill_handler' not in sys.modules
@@ -3,7 +3,9 @@ from unittest import mock
 import pytest
 
 from game import Game, GameDoesNotExist
-from parser import MemoryGameRepository
+from parser import MemoryGameRepository, SnapshotGameRepository, dump_snapshot
+from parser.repositories import ReadOnlyRepository
+from parser.snapshot import HEADER, MAGIC, VERSION
 
 
 class TestMemoryGameRepository:
@@ -37,3 +39,78 @@ class TestMemoryGameRepository:
 
         with pytest.raises(GameDoesNotExist):
             memory_repo.get_game_by_uid('asdasdasd')
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    def test_should_use_own_store(self):
+        shared_repo = MemoryGameRepository()
+        shared_repo.add(Game('abc'))
+        memory_repo = MemoryGameRepository({})
+        memory_repo.add(Game('xyz'))
+        assert list(memory_repo.get_games()) == ['xyz']
+        assert list(shared_repo.get_games()) == ['abc']
+
+
+class TestSnapshotGameRepository:
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    def test_should_load_games_from_snapshot(self, tmpdir,
+                                             game_with_player_with_one_kill):
+        memory_repo = MemoryGameRepository()
+        memory_repo.add(game_with_player_with_one_kill)
+        snapshot_file = str(tmpdir.join('games.snapshot'))
+        dump_snapshot(memory_repo, snapshot_file)
+
+        snapshot_repo = SnapshotGameRepository(snapshot_file)
+        game = snapshot_repo.get_game_by_uid('foo')
+
+        assert game.total_kills == 1
+        assert game.get_player('bar').kills == 1
+        assert snapshot_repo.get_game_by_uid('foo') is not game
+        assert list(snapshot_repo.get_games()) == ['foo']
+
+        with pytest.raises(GameDoesNotExist):
+            snapshot_repo.get_game_by_uid('asdasdasd')
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    def test_should_not_add_games_to_snapshot(self, tmpdir):
+        snapshot_file = str(tmpdir.join('games.snapshot'))
+        dump_snapshot(MemoryGameRepository(), snapshot_file)
+
+        snapshot_repo = SnapshotGameRepository(snapshot_file)
+
+        with pytest.raises(ReadOnlyRepository):
+            snapshot_repo.add(Game('abc'))
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    def test_should_reload_published_snapshot(self, tmpdir):
+        snapshot_file = str(tmpdir.join('games.snapshot'))
+        snapshot_repo = SnapshotGameRepository(snapshot_file)
+        assert snapshot_repo.get_games() == {}
+
+        memory_repo = MemoryGameRepository()
+        memory_repo.add(Game('abc'))
+        dump_snapshot(memory_repo, snapshot_file)
+        assert list(snapshot_repo.get_games()) == ['abc']
+
+        memory_repo.add(Game('xyz'))
+        dump_snapshot(memory_repo, snapshot_file)
+        assert list(snapshot_repo.get_games()) == ['abc', 'xyz']
+        assert snapshot_repo.get_game_by_uid('xyz').uid == 'xyz'
+
+    @mock.patch.object(MemoryGameRepository, 'store', {})
+    def test_should_keep_previous_snapshot_when_new_one_is_invalid(self, tmpdir):
+        snapshot_file = tmpdir.join('games.snapshot')
+        snapshot_file.write_binary(HEADER.pack(MAGIC, VERSION - 1, 0, 0))
+        snapshot_repo = SnapshotGameRepository(str(snapshot_file))
+        assert snapshot_repo.get_games() == {}
+
+        memory_repo = MemoryGameRepository()
+        memory_repo.add(Game('abc'))
+        dump_snapshot(memory_repo, str(snapshot_file))
+        assert list(snapshot_repo.get_games()) == ['abc']
+
+        invalid_file = tmpdir.join('invalid.snapshot')
+        invalid_file.write_binary(b'')
+        invalid_file.rename(snapshot_file)
+        assert list(snapshot_repo.get_games()) == ['abc']
+        assert snapshot_repo.get_game_by_uid('abc').uid == 'abc'
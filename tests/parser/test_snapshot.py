@@ -0,0 +1,80 @@
+import pytest
+
+from game import Game, Player
+from parser.snapshot import (HEADER, MAGIC, VERSION, InvalidSnapshot, decode_game,
+                             decode_header, encode_games, read_handlers)
+
+
+class TestSnapshot:
+
+    def test_should_encode_and_decode_games(self, game_with_player_with_one_kill):
+        game = Game('abc')
+        game.map_name = 'q3dm17'
+        game.shutdown()
+        games = {'abc': game,
+                 game_with_player_with_one_kill.uid: game_with_player_with_one_kill}
+
+        buffer = encode_games(games)
+        names, index = decode_header(buffer)
+
+        assert list(index) == ['abc', 'foo']
+        assert names == ['q3dm17', 'bar']
+
+        offset, size = index['foo']
+        decoded = decode_game(buffer, 'foo', offset, size, names)
+        assert decoded.total_kills == 1
+        assert decoded.is_shutted_down() is False
+        assert decoded.map_name is None
+        assert decoded.get_player('bar').kills == 1
+
+        offset, size = index['abc']
+        decoded = decode_game(buffer, 'abc', offset, size, names)
+        assert decoded.is_shutted_down() is True
+        assert decoded.map_name == 'q3dm17'
+        assert len(decoded.players) == 0
+
+    def test_should_share_player_names_across_games(self):
+        games = {}
+        for uid in ('abc', 'xyz'):
+            game = Game(uid)
+            game.add_player(Player('Zeh'))
+            games[uid] = game
+
+        names, index = decode_header(encode_games(games))
+
+        assert names == ['Zeh']
+
+    def test_should_reject_invalid_snapshot(self):
+        with pytest.raises(InvalidSnapshot):
+            decode_header(b'nope')
+
+        with pytest.raises(InvalidSnapshot):
+            decode_header(b'XXXX' + bytes(10))
+
+    def test_should_reject_truncated_snapshot(self, game_with_player_with_one_kill):
+        buffer = encode_games({'foo': game_with_player_with_one_kill})
+
+        with pytest.raises(InvalidSnapshot):
+            decode_header(buffer[:HEADER.size + 4])
+
+        names, index = decode_header(buffer)
+        offset, size = index['foo']
+        with pytest.raises(InvalidSnapshot):
+            decode_game(buffer[:-1], 'foo', offset, size, names)
+
+        with pytest.raises(InvalidSnapshot):
+            decode_game(buffer, 'foo', offset, size - 1, names)
+
+    def test_should_read_handlers(self, tmpdir):
+        snapshot_file = tmpdir.join('games.snapshot')
+        handlers = 'Kill=parser.handlers.KillEventHandler'
+        snapshot_file.write_binary(encode_games({}, handlers))
+        assert read_handlers(str(snapshot_file)) == handlers
+
+        snapshot_file.write_binary(HEADER.pack(MAGIC, VERSION - 1, 0, 0))
+        with pytest.raises(InvalidSnapshot):
+            read_handlers(str(snapshot_file))
+
+        snapshot_file.write_binary(b'nope')
+        with pytest.raises(InvalidSnapshot):
+            read_handlers(str(snapshot_file))